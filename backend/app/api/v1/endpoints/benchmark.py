@@ -57,18 +57,20 @@ def run_benchmark(request: BenchmarkRequest) -> BenchmarkResponse:
     """Run performance benchmarks for different body counts and step counts."""
     results = []
     
+    simulation = Simulation(timestep=request.timestep, method=request.method)
+    simulation.gravity = Vector3(0, -9.80665, 0)
+    
     for body_count in request.body_counts:
+        # The fixture data is identical for every step count and iteration
+        test_bodies = create_test_bodies(body_count)
+        
         for step_count in request.step_counts:
             execution_times = []
             
             # Run multiple iterations to get average performance
             for _ in range(request.iterations):
-                # Create simulation
-                simulation = Simulation(timestep=request.timestep, method=request.method)
-                simulation.gravity = Vector3(0, -9.80665, 0)
-                
-                # Add test bodies
-                test_bodies = create_test_bodies(body_count)
+                # Start from a clean simulation with fresh bodies
+                simulation.reset()
                 for body_data in test_bodies:
                     body = create_body(
                         identifier=body_data["identifier"],
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from physics.analytics import damped_oscillator
@@ -30,7 +31,7 @@ class OscillatorResponse(BaseModel):
 
 
 @router.post("/solve", response_model=OscillatorResponse)
-def solve_oscillator(request: OscillatorRequest) -> OscillatorResponse:
+def solve_oscillator(request: OscillatorRequest) -> ORJSONResponse:
     result = damped_oscillator(
         mass=request.mass,
         stiffness=request.stiffness,
@@ -41,11 +42,16 @@ def solve_oscillator(request: OscillatorRequest) -> OscillatorResponse:
         samples=request.samples,
     )
 
-    return OscillatorResponse(
-        angular_frequency=result.angular_frequency,
-        period=result.period,
-        trajectory=[
-            OscillatorPoint(time=point.x, displacement=point.y)
-            for point in result.trajectory
-        ],
+    # Skip per-point OscillatorPoint validation; the response model still
+    # documents the schema.  orjson writes the infinite period of overdamped
+    # systems as null.
+    return ORJSONResponse(
+        content={
+            "angular_frequency": result.angular_frequency,
+            "period": result.period,
+            "trajectory": [
+                {"time": point.x, "displacement": point.y}
+                for point in result.trajectory
+            ],
+        }
     )
@@ -4,6 +4,7 @@ from math import radians
 from typing import List
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
 
 from physics.analytics import projectile_motion
@@ -40,7 +41,7 @@ class ProjectileResponse(BaseModel):
 
 
 @router.post("/solve", response_model=ProjectileResponse)
-def solve_projectile(request: ProjectileRequest) -> ProjectileResponse:
+def solve_projectile(request: ProjectileRequest) -> ORJSONResponse:
     result = projectile_motion(
         initial_speed=request.initial_speed,
         launch_angle=radians(request.launch_angle),
@@ -49,9 +50,14 @@ def solve_projectile(request: ProjectileRequest) -> ProjectileResponse:
         samples=request.samples,
     )
 
-    return ProjectileResponse(
-        time_of_flight=result.time_of_flight,
-        max_height=result.max_height,
-        range=result.range,
-        trajectory=[VectorResponse(x=v.x, y=v.y, z=v.z) for v in result.trajectory],
+    # The samples come straight from the solver, so emit plain dicts instead of
+    # validating one VectorResponse per point; the response model still
+    # documents the schema.
+    return ORJSONResponse(
+        content={
+            "time_of_flight": result.time_of_flight,
+            "max_height": result.max_height,
+            "range": result.range,
+            "trajectory": [{"x": v.x, "y": v.y, "z": v.z} for v in result.trajectory],
+        }
     )
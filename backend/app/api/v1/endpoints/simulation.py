@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import List, Literal, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from physics.simulations import Simulation, SimulationResult, create_body
 from physics.vector import Vector3
@@ -26,6 +27,9 @@ class ForcePayload(BaseModel):
     normal_force_magnitude: Optional[float] = None
 
 
+_FORCES_ADAPTER = TypeAdapter(List[ForcePayload])
+
+
 class BodyPayload(BaseModel):
     identifier: str
     mass: float = Field(..., gt=0)
@@ -73,25 +77,34 @@ class SimulationResponse(BaseModel):
     collision_count: int = 0
 
 
-def _serialize_result(result: SimulationResult) -> SimulationResponse:
-    steps: List[List[SimulationStep]] = []
-    for snapshot in result.steps:
-        steps.append(
-            [
-                SimulationStep(body=identifier, position=list(data["position"]), velocity=list(data["velocity"]))
-                for identifier, data in sorted(snapshot.items())
-            ]
-        )
-    return SimulationResponse(
-        total_time=result.total_time, 
-        steps=steps, 
-        energy_profile=result.conserved_energy,
-        collision_count=result.collision_count
-    )
+def _serialize_result(result: SimulationResult) -> dict:
+    # Built by hand: the snapshots come from the engine, so validating one
+    # SimulationStep per body per step would only repeat work.  Reading the
+    # packed per-step arrays directly also skips building ``result.steps``.
+    identifiers = result.identifiers
+    order = sorted(range(len(identifiers)), key=identifiers.__getitem__)
+    steps = []
+    for packed_positions, packed_velocities in zip(result.positions, result.velocities):
+        positions = packed_positions.tolist()
+        velocities = packed_velocities.tolist()
+        steps.append([
+            {
+                "body": identifiers[index],
+                "position": positions[3 * index:3 * index + 3],
+                "velocity": velocities[3 * index:3 * index + 3],
+            }
+            for index in order
+        ])
+    return {
+        "total_time": result.total_time,
+        "steps": steps,
+        "energy_profile": result.conserved_energy,
+        "collision_count": result.collision_count,
+    }
 
 
 @router.post("/run", response_model=SimulationResponse)
-def run_simulation(payload: SimulationRequest) -> SimulationResponse:
+def run_simulation(payload: SimulationRequest) -> ORJSONResponse:
     simulation = Simulation(
         timestep=payload.timestep, 
         method=payload.method,
@@ -100,7 +113,7 @@ def run_simulation(payload: SimulationRequest) -> SimulationResponse:
     simulation.gravity = Vector3.from_iterable(payload.gravity)
 
     for body_payload in payload.bodies:
-        forces = [force.model_dump(exclude_none=True) for force in body_payload.forces] if body_payload.forces else None
+        forces = _FORCES_ADAPTER.dump_python(body_payload.forces, exclude_none=True) if body_payload.forces else None
         body = create_body(
             identifier=body_payload.identifier,
             mass=body_payload.mass,
@@ -114,4 +127,4 @@ def run_simulation(payload: SimulationRequest) -> SimulationResponse:
         simulation.add_body(body)
 
     result = simulation.step(payload.steps)
-    return _serialize_result(result)
+    return ORJSONResponse(content=_serialize_result(result))
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.v1.endpoints import benchmark, health, oscillator, projectile, simulation
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Physics Engine API", version="1.0.0")
+    app = FastAPI(title="Physics Engine API", version="1.0.0", default_response_class=ORJSONResponse)
 
     app.add_middleware(
         CORSMiddleware,
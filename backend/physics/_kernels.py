@@ -0,0 +1,49 @@
+"""Scalar sampling kernels shared by the analytic solvers.
+
+Each kernel works on plain floats and returns plain lists so the solvers can
+wrap the results in :class:`Vector3` in a single pass.  Keeping the numeric
+loops here, away from object construction, also gives a single place to swap
+in a faster implementation later without touching the public solver API.
+"""
+
+from __future__ import annotations
+
+from math import cos, exp, sin
+from typing import List
+
+
+def time_grid(duration: float, samples: int) -> List[float]:
+    """Return ``samples`` evenly spaced instants covering ``[0, duration]``."""
+    dt = duration / max(samples - 1, 1)
+    return [i * dt for i in range(samples)]
+
+
+def projectile_heights(
+    times: List[float],
+    initial_height: float,
+    vertical_speed: float,
+    gravity: float,
+) -> List[float]:
+    half_g = 0.5 * gravity
+    return [initial_height + (vertical_speed - half_g * t) * t for t in times]
+
+
+def oscillator_displacements(
+    times: List[float],
+    zeta: float,
+    omega0: float,
+    omega_d: float,
+    initial_displacement: float,
+    initial_velocity: float,
+) -> List[float]:
+    # Loop invariants: the decay rate and the sine coefficient depend only on
+    # the system parameters, not on the sample time.
+    decay = zeta * omega0
+    sine_coefficient = 0.0 if omega_d == 0 else (initial_velocity + decay * initial_displacement) / omega_d
+    return [
+        exp(-decay * t) * (initial_displacement * cos(omega_d * t) + sine_coefficient * sin(omega_d * t))
+        for t in times
+    ]
+
+
+__all__ = ["time_grid", "projectile_heights", "oscillator_displacements"]
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from math import cos, sin, sqrt
 from typing import List
 
+from ._kernels import oscillator_displacements, projectile_heights, time_grid
 from .vector import Vector3
 
 
@@ -26,18 +27,15 @@ def projectile_motion(
     vy = initial_speed * sin(launch_angle)
 
     discriminant = vy ** 2 + 2 * gravity * initial_height
-    time_of_flight = (vy + sqrt(discriminant)) / gravity
+    if discriminant < 0:
+        raise ValueError("Projectile never reaches ground level from this initial height")
+    time_of_flight = (vy + discriminant ** 0.5) / gravity
 
-    dt = time_of_flight / max(samples - 1, 1)
-    trajectory: List[Vector3] = []
-    max_height = initial_height
-
-    for i in range(samples):
-        t = dt * i
-        x = vx * t
-        y = initial_height + vy * t - 0.5 * gravity * t ** 2
-        max_height = max(max_height, y)
-        trajectory.append(Vector3(x, y, 0.0))
+    times = time_grid(time_of_flight, samples)
+    heights = projectile_heights(times, initial_height, vy, gravity)
+    # heights[0] is the launch height, so it only needs supplying when empty.
+    max_height = max(heights, default=initial_height)
+    trajectory: List[Vector3] = [Vector3(vx * t, y, 0.0) for t, y in zip(times, heights)]
 
     total_range = vx * time_of_flight
     return ProjectileResult(trajectory=trajectory, time_of_flight=time_of_flight, max_height=max_height, range=total_range)
@@ -59,23 +57,15 @@ def damped_oscillator(
     duration: float,
     samples: int = 200,
 ) -> OscillatorResult:
-    from math import exp
-
     omega0 = sqrt(stiffness / mass)
     zeta = damping / (2 * sqrt(mass * stiffness))
     omega_d = omega0 * sqrt(max(1 - zeta ** 2, 0.0))
 
-    trajectory: List[Vector3] = []
-    dt = duration / max(samples - 1, 1)
-
-    for i in range(samples):
-        t = i * dt
-        envelope = exp(-zeta * omega0 * t)
-        displacement = envelope * (
-            initial_displacement * cos(omega_d * t)
-            + ((initial_velocity + zeta * omega0 * initial_displacement) / omega_d if omega_d else 0.0) * sin(omega_d * t)
-        )
-        trajectory.append(Vector3(t, displacement, 0.0))
+    times = time_grid(duration, samples)
+    displacements = oscillator_displacements(
+        times, zeta, omega0, omega_d, initial_displacement, initial_velocity
+    )
+    trajectory: List[Vector3] = [Vector3(t, d, 0.0) for t, d in zip(times, displacements)]
 
     period = (2 * 3.141592653589793 / omega_d) if omega_d else float("inf")
     return OscillatorResult(trajectory=trajectory, period=period, angular_frequency=omega_d)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
-from .vector import Vector3, ZERO_VECTOR
+from .vector import Vector3, _Vec3Accum
 
 if TYPE_CHECKING:
     from .forces import Force
@@ -21,12 +21,22 @@ class Body:
     restitution: float = 0.5
     friction: float = 0.0
     forces: List["Force"] = field(default_factory=list)
+    # Uniform acceleration folded in from ``GravityForce`` tags when the body
+    # joins a simulation; ``None`` until then, in which case any gravity is
+    # still evaluated as an ordinary force.
+    gravity: Optional[Vector3] = field(default=None, repr=False)
+    # Cached reciprocal of ``mass`` so hot paths multiply instead of divide.
+    # Mass is treated as fixed once the body has been created.
+    inv_mass: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.inv_mass = 1.0 / self.mass
 
     def net_force(self) -> Vector3:
-        total = ZERO_VECTOR
+        total = _Vec3Accum()
         for force in self.forces:
-            total += force.compute(self)
-        return total
+            total.add(force.compute(self))
+        return total.freeze()
 
     def add_force(self, force: "Force") -> None:
         self.forces.append(force)
@@ -42,6 +52,13 @@ class Body:
             self.position = original_position
             self.velocity = original_velocity
 
+    def _accel(self, position: Vector3, velocity: Vector3) -> Vector3:
+        """Acceleration at a trial state, passed to integrators as a bound method."""
+        acceleration = self.net_force_for_state(position, velocity) * self.inv_mass
+        if self.gravity is None:
+            return acceleration
+        return acceleration + self.gravity
+
 
 class BodyRegistry:
     """Utility container for bodies keyed by identifier."""
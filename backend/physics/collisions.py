@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from itertools import combinations, starmap
+from math import floor, isfinite
+from typing import Dict, List, Optional, Tuple
 
+from .octree import Octree
 from .vector import Vector3, ZERO_VECTOR
 
 
@@ -17,59 +20,152 @@ class Collision:
     relative_velocity: Vector3
 
 
+def detect_sphere_collision(body1: "Body", body2: "Body") -> Optional[Collision]:
+    """Detect collision between two spherical bodies."""
+    position1 = body1.position
+    position2 = body2.position
+    dx = position2.x - position1.x
+    dy = position2.y - position1.y
+    dz = position2.z - position1.z
+    
+    # Compare squared distances first so the common no-contact case never
+    # pays for a square root or builds any vectors.
+    combined_radius = body1.radius + body2.radius
+    distance_sq = dx * dx + dy * dy + dz * dz
+    if distance_sq >= combined_radius * combined_radius:
+        return None  # No collision
+    
+    # Calculate collision details
+    distance = distance_sq ** 0.5
+    penetration_depth = combined_radius - distance
+    
+    if distance > 0:
+        inv_distance = 1.0 / distance
+        contact_normal = Vector3(dx * inv_distance, dy * inv_distance, dz * inv_distance)
+    else:
+        # Bodies are at same position, use arbitrary normal
+        contact_normal = Vector3(1, 0, 0)
+    
+    # Contact point is on the line between centers
+    contact_point = body1.position + contact_normal * body1.radius
+    
+    # Relative velocity at contact point
+    relative_velocity = body2.velocity - body1.velocity
+    
+    return Collision(
+        body1_id=body1.identifier,
+        body2_id=body2.identifier,
+        contact_point=contact_point,
+        contact_normal=contact_normal,
+        penetration_depth=penetration_depth,
+        relative_velocity=relative_velocity
+    )
+
+
 class CollisionDetector:
     """Handles collision detection between bodies."""
     
+    # Kept as an attribute for callers that go through the class.
+    detect_sphere_collision = staticmethod(detect_sphere_collision)
+    
+    # Below this many bodies scanning every pair is cheaper than building a
+    # spatial index.
+    GRID_THRESHOLD = 16
+    BROAD_PHASES = ("naive", "grid", "octree")
+
     @staticmethod
-    def detect_sphere_collision(body1: "Body", body2: "Body") -> Optional[Collision]:
-        """Detect collision between two spherical bodies."""
-        from .bodies import Body  # Avoid circular import
-        
-        # Calculate distance between centers
-        displacement = body2.position - body1.position
-        distance = displacement.magnitude()
-        
-        # Check if collision occurs (distance less than sum of radii)
-        combined_radius = body1.radius + body2.radius
-        if distance >= combined_radius:
-            return None  # No collision
-        
-        # Calculate collision details
-        penetration_depth = combined_radius - distance
-        
-        if distance > 0:
-            contact_normal = displacement.normalize()
+    def detect_all_collisions(bodies: List["Body"], broad_phase: str = "grid") -> List[Collision]:
+        """Detect all collisions between bodies in the list.
+        
+        ``broad_phase`` selects how candidate pairs are found: ``"naive"``
+        tests every pair, ``"grid"`` buckets bodies into a uniform grid and
+        ``"octree"`` queries an octree, which copes better with bodies of very
+        different sizes or uneven spatial density.
+        """
+        if broad_phase not in CollisionDetector.BROAD_PHASES:
+            raise ValueError(f"Unknown collision broad phase: {broad_phase}")
+        
+        if broad_phase == "naive" or len(bodies) < CollisionDetector.GRID_THRESHOLD:
+            candidates = combinations(bodies, 2)
         else:
-            # Bodies are at same position, use arbitrary normal
-            contact_normal = Vector3(1, 0, 0)
-        
-        # Contact point is on the line between centers
-        contact_point = body1.position + contact_normal * body1.radius
-        
-        # Relative velocity at contact point
-        relative_velocity = body2.velocity - body1.velocity
-        
-        return Collision(
-            body1_id=body1.identifier,
-            body2_id=body2.identifier,
-            contact_point=contact_point,
-            contact_normal=contact_normal,
-            penetration_depth=penetration_depth,
-            relative_velocity=relative_velocity
-        )
+            if broad_phase == "octree":
+                pairs = CollisionDetector._octree_candidate_pairs(bodies)
+            else:
+                pairs = CollisionDetector._grid_candidate_pairs(bodies)
+            candidates = ((bodies[i], bodies[j]) for i, j in pairs)
+        
+        return [
+            collision
+            for collision in starmap(detect_sphere_collision, candidates)
+            if collision is not None
+        ]
     
     @staticmethod
-    def detect_all_collisions(bodies: List["Body"]) -> List[Collision]:
-        """Detect all collisions between bodies in the list."""
-        collisions = []
-        
-        for i in range(len(bodies)):
-            for j in range(i + 1, len(bodies)):
-                collision = CollisionDetector.detect_sphere_collision(bodies[i], bodies[j])
-                if collision:
-                    collisions.append(collision)
-        
-        return collisions
+    def _all_pairs(count: int) -> List[Tuple[int, int]]:
+        return list(combinations(range(count), 2))
+    
+    @staticmethod
+    def _grid_candidate_pairs(bodies: List["Body"]) -> List[Tuple[int, int]]:
+        """Broad phase: bucket bodies into a uniform grid and pair up neighbours.
+        
+        With cells twice the largest radius, two touching spheres always sit in
+        the same or adjacent cells, so only the 27 surrounding cells need to be
+        searched.  Pairs are returned in the same ``(i, j)`` order as the
+        all-pairs scan so collision resolution stays deterministic.
+        """
+        cell_size = 2 * max(body.radius for body in bodies)
+        if cell_size <= 0:
+            return CollisionDetector._all_pairs(len(bodies))
+        
+        grid: Dict[Tuple[int, int, int], List[int]] = {}
+        cells: List[Tuple[int, int, int]] = []
+        try:
+            for index, body in enumerate(bodies):
+                position = body.position
+                key = (
+                    floor(position.x / cell_size),
+                    floor(position.y / cell_size),
+                    floor(position.z / cell_size),
+                )
+                cells.append(key)
+                grid.setdefault(key, []).append(index)
+        except (ValueError, OverflowError):
+            # Non-finite positions cannot be bucketed; fall back to the full scan.
+            return CollisionDetector._all_pairs(len(bodies))
+        
+        pairs = set()
+        for i, (cx, cy, cz) in enumerate(cells):
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        for j in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                            if j > i:
+                                pairs.add((i, j))
+        
+        return sorted(pairs)
+    
+    @staticmethod
+    def _octree_candidate_pairs(bodies: List["Body"]) -> List[Tuple[int, int]]:
+        """Broad phase: query an octree of body centres around each body.
+        
+        Two spheres can only touch if their centres are closer than
+        ``radius + max_radius``, so each body's query box is its centre padded
+        by that amount.
+        """
+        centres = [body.position.to_tuple() for body in bodies]
+        if not all(isfinite(value) for centre in centres for value in centre):
+            return CollisionDetector._all_pairs(len(bodies))
+        
+        tree = Octree(centres)
+        max_radius = max(body.radius for body in bodies)
+        pairs = []
+        for i, ((x, y, z), body) in enumerate(zip(centres, bodies)):
+            reach = body.radius + max_radius
+            for j in tree.query((x - reach, y - reach, z - reach), (x + reach, y + reach, z + reach)):
+                if j > i:
+                    pairs.append((i, j))
+        
+        return sorted(pairs)
 
 
 class CollisionResolver:
@@ -77,10 +173,16 @@ class CollisionResolver:
     
     @staticmethod
     def resolve_collision(collision: Collision, body1: "Body", body2: "Body", dt: float) -> None:
-        """Resolve a collision between two bodies using impulse-based response."""
+        """Resolve a collision between two bodies using impulse-based response.
+        
+        The impulse and the positional correction share the contact normal and
+        inverse masses, so both are applied per component in a single pass
+        without building intermediate impulse or correction vectors.
+        """
+        normal = collision.contact_normal
         
         # Calculate relative velocity in collision normal direction
-        relative_velocity_normal = collision.relative_velocity.dot(collision.contact_normal)
+        relative_velocity_normal = collision.relative_velocity.dot(normal)
         
         # Objects are separating, no need to resolve
         if relative_velocity_normal > 0:
@@ -89,37 +191,38 @@ class CollisionResolver:
         # Calculate restitution (bounce factor)
         restitution = min(body1.restitution, body2.restitution)
         
-        # Calculate impulse magnitude
-        impulse_magnitude = -(1 + restitution) * relative_velocity_normal
-        impulse_magnitude /= (1/body1.mass + 1/body2.mass)
-        
-        # Apply impulse to velocities
-        impulse = collision.contact_normal * impulse_magnitude
-        body1.velocity -= impulse / body1.mass
-        body2.velocity += impulse / body2.mass
-        
-        # Position correction to prevent sinking
-        CollisionResolver._position_correction(collision, body1, body2)
-    
-    @staticmethod
-    def _position_correction(collision: Collision, body1: "Body", body2: "Body") -> None:
-        """Apply position correction to prevent bodies from sinking into each other."""
-        
-        # Percentage of penetration to correct (usually 0.2-0.8)
+        inv_mass1 = body1.inv_mass
+        inv_mass2 = body2.inv_mass
+        inv_mass_sum = inv_mass1 + inv_mass2
+        nx, ny, nz = normal.x, normal.y, normal.z
+        
+        # Calculate impulse magnitude and apply it to velocities
+        impulse_magnitude = -(1 + restitution) * relative_velocity_normal / inv_mass_sum
+        dv1 = impulse_magnitude * inv_mass1
+        dv2 = impulse_magnitude * inv_mass2
+        v1 = body1.velocity
+        v2 = body2.velocity
+        body1.velocity = Vector3(v1.x - nx * dv1, v1.y - ny * dv1, v1.z - nz * dv1)
+        body2.velocity = Vector3(v2.x + nx * dv2, v2.y + ny * dv2, v2.z + nz * dv2)
+        
+        # Position correction to prevent sinking: push out a percentage of the
+        # penetration (usually 0.2-0.8), ignoring a small slop that would
+        # otherwise cause jitter.
         correction_percentage = 0.4
-        # Slop to allow minor penetrations (prevents jitter)
         slop = 0.01
         
-        correction = max(collision.penetration_depth - slop, 0.0) / (1/body1.mass + 1/body2.mass)
-        correction *= correction_percentage
-        
-        correction_vector = collision.contact_normal * correction
-        body1.position -= correction_vector / body1.mass
-        body2.position += correction_vector / body2.mass
+        correction = max(collision.penetration_depth - slop, 0.0) / inv_mass_sum * correction_percentage
+        dp1 = correction * inv_mass1
+        dp2 = correction * inv_mass2
+        p1 = body1.position
+        p2 = body2.position
+        body1.position = Vector3(p1.x - nx * dp1, p1.y - ny * dp1, p1.z - nz * dp1)
+        body2.position = Vector3(p2.x + nx * dp2, p2.y + ny * dp2, p2.z + nz * dp2)
 
 
 __all__ = [
     "Collision",
+    "detect_sphere_collision",
     "CollisionDetector", 
     "CollisionResolver"
 ]
\ No newline at end of file
@@ -5,9 +5,10 @@ Constraint and joint system for multi-body physics simulations.
 from __future__ import annotations
 
 import math
-from abc import ABC, abstractmethod
+from abc import ABC
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from .vector import Vector3
 
@@ -16,12 +17,65 @@ if TYPE_CHECKING:
 
 
 class Constraint(ABC):
-    """Base class for constraints between bodies."""
+    """
+    Base class for constraints between bodies.
+    
+    Subclasses implement ``body_ids`` and ``apply_resolved`` so the solver can
+    look their bodies up once per solve.  Subclasses that only override
+    ``apply`` still work; the solver calls ``apply`` for them instead.
+    Defining a subclass that provides neither raises ``TypeError``.
+    """
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls._implements_resolved():
+            if cls.body_ids is Constraint.body_ids:
+                raise TypeError(f"{cls.__name__} implements apply_resolved but not body_ids")
+        elif cls.apply is Constraint.apply:
+            raise TypeError(f"{cls.__name__} must implement apply_resolved and body_ids, or apply")
+    
+    def __new__(cls, *args, **kwargs):
+        if cls is Constraint:
+            raise TypeError("Can't instantiate abstract class Constraint")
+        return super().__new__(cls)
+    
+    # Whether sweeps drive the returned violation toward zero, so that the
+    # solver may stop sweeping the constraint once it is below tolerance.
+    # Force-like constraints that only change velocities leave their
+    # violation unchanged between sweeps and are applied every iteration.
+    settles = True
+    
+    @property
+    def body_ids(self) -> Tuple[str, ...]:
+        """Identifiers of the bodies this constraint acts on."""
+        return ()
+    
+    def apply_resolved(self, bodies: Tuple["Body", ...], dt: float) -> float:
+        """
+        Apply the constraint to bodies already looked up in ``body_ids`` order.
+        
+        Returns the violation found before correcting, or ``0.0`` when the
+        constraint was already satisfied.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement apply_resolved")
+    
+    @classmethod
+    def _implements_resolved(cls) -> bool:
+        """Whether the subclass provides ``apply_resolved`` rather than only ``apply``."""
+        return cls.apply_resolved is not Constraint.apply_resolved
+    
+    def resolve(self, bodies: "BodyRegistry") -> Optional[Tuple["Body", ...]]:
+        """Look up the constrained bodies, or return ``None`` if any is missing."""
+        try:
+            return tuple(bodies.get(identifier) for identifier in self.body_ids)
+        except KeyError:
+            return None
     
-    @abstractmethod
     def apply(self, bodies: "BodyRegistry", dt: float) -> None:
         """Apply the constraint to the bodies."""
-        pass
+        resolved = self.resolve(bodies)
+        if resolved is not None:
+            self.apply_resolved(resolved, dt)
 
 
 @dataclass
@@ -33,68 +87,106 @@ class DistanceConstraint(Constraint):
     target_distance: float
     stiffness: float = 1.0  # How rigidly the constraint is enforced (0-1)
     
-    def apply(self, bodies: "BodyRegistry", dt: float) -> None:
+    @property
+    def body_ids(self) -> Tuple[str, ...]:
+        return (self.body1_id, self.body2_id)
+    
+    def apply_resolved(self, bodies: Tuple["Body", ...], dt: float) -> float:
         """Apply distance constraint between two bodies."""
-        try:
-            body1 = bodies.get(self.body1_id)
-            body2 = bodies.get(self.body2_id)
-        except KeyError:
-            return  # One or both bodies don't exist
+        body1, body2 = bodies
         
-        # Calculate current distance and displacement
-        displacement = body2.position - body1.position
-        current_distance = displacement.magnitude()
+        # Work on scalar components so a correction allocates only the two new
+        # positions.  The checks below use squared distances so satisfied
+        # constraints never pay for a square root.
+        position1 = body1.position
+        position2 = body2.position
+        dx = position2.x - position1.x
+        dy = position2.y - position1.y
+        dz = position2.z - position1.z
+        distance_sq = dx * dx + dy * dy + dz * dz
+        
+        if distance_sq < 1e-20:
+            return 0.0  # Bodies at same position, can't apply constraint
         
-        if current_distance < 1e-10:
-            return  # Bodies at same position, can't apply constraint
+        # Already satisfied when |distance - target| < 1e-6
+        lower = max(self.target_distance - 1e-6, 0.0)
+        upper = self.target_distance + 1e-6
+        if lower * lower < distance_sq < upper * upper:
+            return 0.0
         
         # Calculate constraint violation
+        current_distance = math.sqrt(distance_sq)
         violation = current_distance - self.target_distance
-        if abs(violation) < 1e-6:
-            return  # Already satisfied
-        
-        # Calculate constraint force direction
-        direction = displacement / current_distance
         
-        # Calculate relative mass factor
-        mass_factor = 1 / (body1.mass + body2.mass)
+        _shift_apart(body1, body2, dx, dy, dz, violation * self.stiffness * 0.5 / current_distance)
+        return violation
+    
+    def warm_start(self, bodies: Tuple["Body", ...], correction: float) -> None:
+        """Re-apply a correction carried over from the previous timestep."""
+        body1, body2 = bodies
+        position1 = body1.position
+        position2 = body2.position
+        dx = position2.x - position1.x
+        dy = position2.y - position1.y
+        dz = position2.z - position1.z
+        distance_sq = dx * dx + dy * dy + dz * dz
         
-        # Apply position correction proportional to masses
-        correction = violation * self.stiffness * 0.5
-        correction_vector = direction * correction
+        if distance_sq < 1e-20:
+            return
         
-        body1.position += correction_vector * (body2.mass * mass_factor)
-        body2.position -= correction_vector * (body1.mass * mass_factor)
+        _shift_apart(body1, body2, dx, dy, dz, correction / math.sqrt(distance_sq))
+
+
+def _shift_apart(body1: "Body", body2: "Body", dx: float, dy: float, dz: float, scale: float) -> None:
+    """
+    Move two bodies along their displacement ``(dx, dy, dz)`` scaled by ``scale``.
+    
+    Positive scales pull the bodies together; each body moves in proportion
+    to the other body's share of the total mass.
+    """
+    mass_factor = 1 / (body1.mass + body2.mass)
+    scale1 = scale * body2.mass * mass_factor
+    scale2 = scale * body1.mass * mass_factor
+    
+    position1 = body1.position
+    position2 = body2.position
+    body1.position = Vector3(position1.x + dx * scale1, position1.y + dy * scale1, position1.z + dz * scale1)
+    body2.position = Vector3(position2.x - dx * scale2, position2.y - dy * scale2, position2.z - dz * scale2)
 
 
 @dataclass 
 class SpringConstraint(Constraint):
     """A spring constraint between two bodies."""
     
+    settles = False
+    
     body1_id: str
     body2_id: str
     rest_length: float
     spring_constant: float  # Stiffness of the spring
     damping: float = 0.0   # Damping coefficient
     
-    def apply(self, bodies: "BodyRegistry", dt: float) -> None:
+    @property
+    def body_ids(self) -> Tuple[str, ...]:
+        return (self.body1_id, self.body2_id)
+    
+    def apply_resolved(self, bodies: Tuple["Body", ...], dt: float) -> float:
         """Apply spring force between two bodies."""
-        try:
-            body1 = bodies.get(self.body1_id)
-            body2 = bodies.get(self.body2_id)
-        except KeyError:
-            return  # One or both bodies don't exist
+        body1, body2 = bodies
         
         # Calculate displacement and distance
         displacement = body2.position - body1.position
-        current_distance = displacement.magnitude()
+        distance_sq = displacement.magnitude_sq()
+        
+        if distance_sq < 1e-20:
+            return 0.0  # Bodies at same position
         
-        if current_distance < 1e-10:
-            return  # Bodies at same position
+        current_distance = math.sqrt(distance_sq)
+        extension = current_distance - self.rest_length
         
         # Spring force: F = -k * (current_length - rest_length)
-        spring_force_magnitude = -self.spring_constant * (current_distance - self.rest_length)
-        direction = displacement / current_distance
+        spring_force_magnitude = -self.spring_constant * extension
+        direction = displacement.scale(1.0 / current_distance)
         spring_force = direction * spring_force_magnitude
         
         # Add damping based on relative velocity
@@ -106,8 +198,9 @@ class SpringConstraint(Constraint):
         # Apply forces (Newton's third law)
         # Force is applied as an impulse over the timestep
         impulse = spring_force * dt
-        body1.velocity -= impulse / body1.mass
-        body2.velocity += impulse / body2.mass
+        body1.velocity -= impulse * body1.inv_mass
+        body2.velocity += impulse * body2.inv_mass
+        return extension
 
 
 @dataclass
@@ -118,22 +211,38 @@ class PinConstraint(Constraint):
     anchor_position: Vector3
     stiffness: float = 1.0
     
-    def apply(self, bodies: "BodyRegistry", dt: float) -> None:
+    @property
+    def body_ids(self) -> Tuple[str, ...]:
+        return (self.body_id,)
+    
+    def apply_resolved(self, bodies: Tuple["Body", ...], dt: float) -> float:
         """Pin body to anchor position."""
-        try:
-            body = bodies.get(self.body_id)
-        except KeyError:
-            return  # Body doesn't exist
+        (body,) = bodies
         
-        # Calculate displacement from anchor
-        displacement = body.position - self.anchor_position
+        # Work on scalar components: a settled pin allocates nothing, and an
+        # active one allocates only the new position and velocity.
+        position = body.position
+        velocity = body.velocity
+        anchor = self.anchor_position
+        dx = position.x - anchor.x
+        dy = position.y - anchor.y
+        dz = position.z - anchor.z
+        offset_sq = dx * dx + dy * dy + dz * dz
+        speed_sq = velocity.x * velocity.x + velocity.y * velocity.y + velocity.z * velocity.z
+        if offset_sq == 0.0 and speed_sq == 0.0:
+            return 0.0
         
         # Apply position correction
-        correction = displacement * self.stiffness
-        body.position -= correction
+        stiffness = self.stiffness
+        body.position = Vector3(position.x - dx * stiffness, position.y - dy * stiffness, position.z - dz * stiffness)
         
         # Also damp velocity towards the anchor
-        body.velocity *= (1.0 - self.stiffness * dt)
+        damping = 1.0 - stiffness * dt
+        body.velocity = Vector3(velocity.x * damping, velocity.y * damping, velocity.z * damping)
+        
+        # A pinned body still drifting is not settled even when it sits on
+        # the anchor, so the residual covers the distance it would move next.
+        return math.sqrt(max(offset_sq, speed_sq * dt * dt))
 
 
 @dataclass
@@ -144,32 +253,50 @@ class RevoluteJoint(Constraint):
     body2_id: str
     anchor_point: Vector3  # World space anchor point
     
-    def apply(self, bodies: "BodyRegistry", dt: float) -> None:
+    @property
+    def body_ids(self) -> Tuple[str, ...]:
+        return (self.body1_id, self.body2_id)
+    
+    def apply_resolved(self, bodies: Tuple["Body", ...], dt: float) -> float:
         """Apply revolute joint constraint."""
-        try:
-            body1 = bodies.get(self.body1_id)
-            body2 = bodies.get(self.body2_id)
-        except KeyError:
-            return  # One or both bodies don't exist
+        body1, body2 = bodies
         
         # Calculate center of mass
         total_mass = body1.mass + body2.mass
-        com = (body1.position * body1.mass + body2.position * body2.mass) / total_mass
+        mass_factor = 1 / total_mass
+        com = (body1.position * body1.mass + body2.position * body2.mass).scale(mass_factor)
         
         # Move center of mass to anchor point
         correction = self.anchor_point - com
         
         # Apply position corrections proportional to masses
-        mass_factor = 1 / total_mass
         body1.position += correction * (body1.mass * mass_factor)
         body2.position += correction * (body2.mass * mass_factor)
+        return correction.magnitude()
 
 
 class ConstraintSolver:
     """Solver for applying constraints to bodies."""
     
-    def __init__(self):
+    # Constraints whose violation falls below this are skipped for the rest
+    # of the solve.
+    DEFAULT_TOLERANCE = 1e-6
+    
+    def __init__(self, warm_start: bool = False):
         self.constraints: List[Constraint] = []
+        # Opt-in: distance constraints start each solve from the correction
+        # they accumulated in the previous one, keyed by ``id(constraint)``.
+        # Corrections are projected straight into positions, so re-applying
+        # one only pays off under a steady load (a chain hanging under
+        # gravity, which drifts by the same amount every step); a one-off
+        # violation is corrected twice and overshoots.
+        self.warm_start = warm_start
+        self._last_correction: Dict[int, float] = {}
+        # Solve order, and the snapshot of ``constraints`` it was built from;
+        # ``solve`` reorders whenever the list no longer matches, so direct
+        # edits of ``constraints`` are picked up as well.
+        self._ordered: List[Constraint] = []
+        self._ordered_from: List[Constraint] = []
     
     def add_constraint(self, constraint: Constraint) -> None:
         """Add a constraint to the solver."""
@@ -179,23 +306,133 @@ class ConstraintSolver:
         """Remove a constraint from the solver."""
         if constraint in self.constraints:
             self.constraints.remove(constraint)
+            self._last_correction.pop(id(constraint), None)
     
     def clear_constraints(self) -> None:
         """Remove all constraints."""
         self.constraints.clear()
+        self._last_correction.clear()
+        self._ordered = []
+        self._ordered_from = []
+    
+    def reorder(self) -> None:
+        """
+        Order constraints so that consecutive ones share bodies.
+        
+        Walks the body adjacency graph breadth-first from each constraint in
+        insertion order, emitting all unvisited constraints on a body before
+        moving on, so each body's constraints are contiguous and corrections
+        propagate along chains within a single Gauss-Seidel sweep.
+        ``constraints`` itself keeps its insertion order.
+        """
+        touching: Dict[str, List[int]] = defaultdict(list)
+        for index, constraint in enumerate(self.constraints):
+            for identifier in constraint.body_ids:
+                touching[identifier].append(index)
+        
+        emitted = [False] * len(self.constraints)
+        ordered: List[Constraint] = []
+        for seed in range(len(self.constraints)):
+            if emitted[seed]:
+                continue
+            emitted[seed] = True
+            queue = deque([seed])
+            while queue:
+                constraint = self.constraints[queue.popleft()]
+                ordered.append(constraint)
+                for identifier in constraint.body_ids:
+                    for neighbour in touching[identifier]:
+                        if not emitted[neighbour]:
+                            emitted[neighbour] = True
+                            queue.append(neighbour)
+        
+        self._ordered = ordered
+        self._ordered_from = list(self.constraints)
+    
+    def _order_is_stale(self) -> bool:
+        """Whether ``constraints`` changed since the solve order was built."""
+        current = self.constraints
+        built_from = self._ordered_from
+        return len(current) != len(built_from) or any(
+            constraint is not previous for constraint, previous in zip(current, built_from)
+        )
     
-    def solve(self, bodies: "BodyRegistry", dt: float, iterations: int = 1) -> None:
+    def solve(
+        self,
+        bodies: "BodyRegistry",
+        dt: float,
+        iterations: int = 1,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ) -> None:
         """
         Solve all constraints for the given timestep.
         
         Args:
             bodies: Registry of bodies to apply constraints to
             dt: Time step
-            iterations: Number of solver iterations (more = more accurate)
+            iterations: Maximum number of solver iterations (more = more accurate)
+            tolerance: Violation below which a constraint counts as converged
+                and is skipped on later iterations
         """
+        if self._order_is_stale():
+            self.reorder()
+        
+        # Look the bodies up once per solve rather than once per iteration;
+        # constraints whose bodies are missing are skipped entirely.
+        resolved = []
+        settles: List[bool] = []
+        keys: List[Optional[int]] = []
+        gains: List[float] = []
+        totals: List[float] = []
+        for constraint in self._ordered:
+            if not constraint._implements_resolved():
+                # Constraints written against the ``apply``-only interface
+                # report no violation, so they are applied every iteration.
+                resolved.append((lambda _targets, step, constraint=constraint: constraint.apply(bodies, step), ()))
+                settles.append(False)
+                keys.append(None)
+                gains.append(0.0)
+                totals.append(0.0)
+                continue
+            targets = constraint.resolve(bodies)
+            if targets is None:
+                continue
+            key = None
+            gain = 0.0
+            carried = 0.0
+            if self.warm_start and isinstance(constraint, DistanceConstraint):
+                # Each sweep moves the bodies by violation * stiffness / 2.
+                key = id(constraint)
+                gain = constraint.stiffness * 0.5
+                carried = self._last_correction.get(key, 0.0)
+                if carried:
+                    constraint.warm_start(targets, carried)
+            resolved.append((constraint.apply_resolved, targets))
+            settles.append(constraint.settles)
+            keys.append(key)
+            gains.append(gain)
+            totals.append(carried)
+        
+        active = [True] * len(resolved)
         for _ in range(iterations):
-            for constraint in self.constraints:
-                constraint.apply(bodies, dt)
+            remaining = 0
+            for index, (apply, targets) in enumerate(resolved):
+                if not active[index]:
+                    continue
+                violation = apply(targets, dt)
+                if gains[index]:
+                    totals[index] += violation * gains[index]
+                if settles[index] and abs(violation) < tolerance:
+                    active[index] = False
+                else:
+                    remaining += 1
+            if not remaining:
+                break
+        
+        if self.warm_start:
+            self._last_correction = {
+                key: total for key, total in zip(keys, totals) if key is not None
+            }
 
 
 # Factory functions for creating common constraint setups
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Tuple
 
 from .vector import Vector3
 
+# Maps a trial state ``(px, py, pz, vx, vy, vz)`` to ``(ax, ay, az)``.
+AccelerationKernel = Callable[[float, float, float, float, float, float], Tuple[float, float, float]]
+
 StateFunction = Callable[[float, "Vector3", "Vector3"], "Vector3"]
 
 
@@ -13,9 +16,13 @@ def euler_step(
     velocity: Vector3,
     acceleration: Vector3,
 ) -> tuple[Vector3, Vector3]:
-    new_velocity = velocity + acceleration * dt
-    new_position = position + new_velocity * dt
-    return new_position, new_velocity
+    # Semi-implicit Euler written per component so only the two result vectors
+    # are allocated instead of one temporary per operator.
+    vx = velocity.x + acceleration.x * dt
+    vy = velocity.y + acceleration.y * dt
+    vz = velocity.z + acceleration.z * dt
+    new_position = Vector3(position.x + vx * dt, position.y + vy * dt, position.z + vz * dt)
+    return new_position, Vector3(vx, vy, vz)
 
 
 def rk4_step(
@@ -24,26 +31,105 @@ def rk4_step(
     velocity: Vector3,
     acceleration_func: Callable[[Vector3, Vector3], Vector3],
 ) -> tuple[Vector3, Vector3]:
-    # Runge–Kutta 4 integration for both position and velocity.
-    def dv(pos: Vector3, vel: Vector3) -> Vector3:
-        return acceleration_func(pos, vel)
+    # Runge–Kutta 4 integration for both position and velocity, fused per
+    # component.  The stage velocities double as the position derivatives, so
+    # the only vectors built are the stage states handed to
+    # ``acceleration_func`` and the final result.
+    half_dt = dt / 2
+    px, py, pz = position.x, position.y, position.z
+    vx, vy, vz = velocity.x, velocity.y, velocity.z
+
+    a1 = acceleration_func(position, velocity)
+
+    v2x = vx + a1.x * half_dt
+    v2y = vy + a1.y * half_dt
+    v2z = vz + a1.z * half_dt
+    a2 = acceleration_func(
+        Vector3(px + vx * half_dt, py + vy * half_dt, pz + vz * half_dt),
+        Vector3(v2x, v2y, v2z),
+    )
+
+    v3x = vx + a2.x * half_dt
+    v3y = vy + a2.y * half_dt
+    v3z = vz + a2.z * half_dt
+    a3 = acceleration_func(
+        Vector3(px + v2x * half_dt, py + v2y * half_dt, pz + v2z * half_dt),
+        Vector3(v3x, v3y, v3z),
+    )
+
+    v4x = vx + a3.x * dt
+    v4y = vy + a3.y * dt
+    v4z = vz + a3.z * dt
+    a4 = acceleration_func(
+        Vector3(px + v3x * dt, py + v3y * dt, pz + v3z * dt),
+        Vector3(v4x, v4y, v4z),
+    )
+
+    sixth_dt = dt / 6
+    new_velocity = Vector3(
+        vx + (a1.x + 2 * a2.x + 2 * a3.x + a4.x) * sixth_dt,
+        vy + (a1.y + 2 * a2.y + 2 * a3.y + a4.y) * sixth_dt,
+        vz + (a1.z + 2 * a2.z + 2 * a3.z + a4.z) * sixth_dt,
+    )
+    new_position = Vector3(
+        px + (vx + 2 * v2x + 2 * v3x + v4x) * sixth_dt,
+        py + (vy + 2 * v2y + 2 * v3y + v4y) * sixth_dt,
+        pz + (vz + 2 * v2z + 2 * v3z + v4z) * sixth_dt,
+    )
+
+    return new_position, new_velocity
+
+
+def rk4_step_kernel(
+    dt: float,
+    position: Vector3,
+    velocity: Vector3,
+    acceleration: AccelerationKernel,
+) -> tuple[Vector3, Vector3]:
+    """RK4 step driven by a scalar acceleration kernel.
+
+    Same scheme as :func:`rk4_step`, but the stage states stay in local floats
+    and are passed to ``acceleration`` directly, so the only vectors allocated
+    are the two results.
+    """
+    half_dt = dt / 2
+    px, py, pz = position.x, position.y, position.z
+    vx, vy, vz = velocity.x, velocity.y, velocity.z
 
-    k1_v = dv(position, velocity)
-    k1_p = velocity
+    a1x, a1y, a1z = acceleration(px, py, pz, vx, vy, vz)
 
-    k2_v = dv(position + k1_p * (dt / 2), velocity + k1_v * (dt / 2))
-    k2_p = velocity + k1_v * (dt / 2)
+    v2x = vx + a1x * half_dt
+    v2y = vy + a1y * half_dt
+    v2z = vz + a1z * half_dt
+    a2x, a2y, a2z = acceleration(
+        px + vx * half_dt, py + vy * half_dt, pz + vz * half_dt, v2x, v2y, v2z
+    )
 
-    k3_v = dv(position + k2_p * (dt / 2), velocity + k2_v * (dt / 2))
-    k3_p = velocity + k2_v * (dt / 2)
+    v3x = vx + a2x * half_dt
+    v3y = vy + a2y * half_dt
+    v3z = vz + a2z * half_dt
+    a3x, a3y, a3z = acceleration(
+        px + v2x * half_dt, py + v2y * half_dt, pz + v2z * half_dt, v3x, v3y, v3z
+    )
 
-    k4_v = dv(position + k3_p * dt, velocity + k3_v * dt)
-    k4_p = velocity + k3_v * dt
+    v4x = vx + a3x * dt
+    v4y = vy + a3y * dt
+    v4z = vz + a3z * dt
+    a4x, a4y, a4z = acceleration(px + v3x * dt, py + v3y * dt, pz + v3z * dt, v4x, v4y, v4z)
 
-    new_velocity = velocity + (k1_v + 2 * k2_v + 2 * k3_v + k4_v) * (dt / 6)
-    new_position = position + (k1_p + 2 * k2_p + 2 * k3_p + k4_p) * (dt / 6)
+    sixth_dt = dt / 6
+    new_velocity = Vector3(
+        vx + (a1x + 2 * a2x + 2 * a3x + a4x) * sixth_dt,
+        vy + (a1y + 2 * a2y + 2 * a3y + a4y) * sixth_dt,
+        vz + (a1z + 2 * a2z + 2 * a3z + a4z) * sixth_dt,
+    )
+    new_position = Vector3(
+        px + (vx + 2 * v2x + 2 * v3x + v4x) * sixth_dt,
+        py + (vy + 2 * v2y + 2 * v3y + v4y) * sixth_dt,
+        pz + (vz + 2 * v2z + 2 * v3z + v4z) * sixth_dt,
+    )
 
     return new_position, new_velocity
 
 
-__all__ = ["euler_step", "rk4_step"]
+__all__ = ["AccelerationKernel", "euler_step", "rk4_step", "rk4_step_kernel"]
@@ -0,0 +1,105 @@
+"""Octree spatial index used as a collision broad phase."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+Point = Tuple[float, float, float]
+
+
+class _Node:
+    __slots__ = ("lower", "upper", "indices", "children")
+
+    def __init__(self, lower: Point, upper: Point) -> None:
+        self.lower = lower
+        self.upper = upper
+        self.indices: List[int] = []
+        self.children: Optional[List["_Node"]] = None
+
+
+class Octree:
+    """Point octree over a fixed set of positions.
+
+    Leaves hold at most ``LEAF_CAPACITY`` points; deeper splits stop at
+    ``MAX_DEPTH`` so coincident points cannot recurse forever.  The tree is
+    cheap to build, so callers are expected to rebuild it every step rather
+    than update it incrementally.
+    """
+
+    LEAF_CAPACITY = 8
+    MAX_DEPTH = 16
+
+    def __init__(self, points: Sequence[Point]) -> None:
+        self.points = list(points)
+        if not self.points:
+            self.root = _Node((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+            return
+
+        xs, ys, zs = zip(*self.points)
+        lower = (min(xs), min(ys), min(zs))
+        upper = (max(xs), max(ys), max(zs))
+        self.root = self._build(list(range(len(self.points))), lower, upper, 0)
+
+    def _build(self, indices: List[int], lower: Point, upper: Point, depth: int) -> _Node:
+        node = _Node(lower, upper)
+        if len(indices) <= self.LEAF_CAPACITY or depth >= self.MAX_DEPTH:
+            node.indices = indices
+            return node
+
+        mid = (
+            (lower[0] + upper[0]) * 0.5,
+            (lower[1] + upper[1]) * 0.5,
+            (lower[2] + upper[2]) * 0.5,
+        )
+        buckets: List[List[int]] = [[] for _ in range(8)]
+        points = self.points
+        for index in indices:
+            x, y, z = points[index]
+            octant = (x > mid[0]) | ((y > mid[1]) << 1) | ((z > mid[2]) << 2)
+            buckets[octant].append(index)
+
+        node.children = []
+        for octant, bucket in enumerate(buckets):
+            if not bucket:
+                continue
+            child_lower = (
+                mid[0] if octant & 1 else lower[0],
+                mid[1] if octant & 2 else lower[1],
+                mid[2] if octant & 4 else lower[2],
+            )
+            child_upper = (
+                upper[0] if octant & 1 else mid[0],
+                upper[1] if octant & 2 else mid[1],
+                upper[2] if octant & 4 else mid[2],
+            )
+            node.children.append(self._build(bucket, child_lower, child_upper, depth + 1))
+        return node
+
+    def query(self, lower: Point, upper: Point) -> List[int]:
+        """Return indices of all points inside the axis-aligned box ``[lower, upper]``."""
+        found: List[int] = []
+        points = self.points
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if (
+                node.upper[0] < lower[0] or node.lower[0] > upper[0]
+                or node.upper[1] < lower[1] or node.lower[1] > upper[1]
+                or node.upper[2] < lower[2] or node.lower[2] > upper[2]
+            ):
+                continue
+            if node.children is not None:
+                stack.extend(node.children)
+                continue
+            for index in node.indices:
+                x, y, z = points[index]
+                if (
+                    lower[0] <= x <= upper[0]
+                    and lower[1] <= y <= upper[1]
+                    and lower[2] <= z <= upper[2]
+                ):
+                    found.append(index)
+        return found
+
+
+__all__ = ["Octree"]
@@ -1,22 +1,54 @@
 from __future__ import annotations
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .bodies import Body, BodyRegistry
 from .collisions import CollisionDetector, CollisionResolver
 from .constraints import ConstraintSolver
-from .forces import ConstantForce, GravityForce
-from .integrators import euler_step, rk4_step
-from .vector import Vector3
+from .forces import ConstantForce, GravityForce, compile_acceleration
+from .integrators import AccelerationKernel, euler_step, rk4_step, rk4_step_kernel
+from .vector import Vector3, ZERO_VECTOR
 
 
 @dataclass
 class SimulationResult:
-    steps: List[Dict[str, dict]]
+    """Recorded trajectory of a simulation run.
+
+    State is stored compactly: for every step, ``positions`` and
+    ``velocities`` hold one ``array('d')`` of ``x, y, z`` triples laid out in
+    ``identifiers`` order.  The per-body dictionaries of :attr:`steps` are
+    built from them on first access.
+    """
+
+    identifiers: List[str]
+    positions: List[array]
+    velocities: List[array]
     total_time: float
     conserved_energy: List[float]
     collision_count: int = 0
+    _steps: Optional[List[Dict[str, dict]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def steps(self) -> List[Dict[str, dict]]:
+        """Snapshots of ``{identifier: {"position": ..., "velocity": ...}}`` per step."""
+        if self._steps is None:
+            self._steps = [
+                {
+                    identifier: {
+                        "position": tuple(positions[offset:offset + 3]),
+                        "velocity": tuple(velocities[offset:offset + 3]),
+                    }
+                    for offset, identifier in zip(range(0, 3 * len(self.identifiers), 3), self.identifiers)
+                }
+                for positions, velocities in zip(self.positions, self.velocities)
+            ]
+        return self._steps
 
 
 @dataclass
@@ -26,82 +58,270 @@ class Simulation:
     gravity: Vector3 = Vector3(0.0, -9.80665, 0.0)
     bodies: BodyRegistry = field(default_factory=BodyRegistry)
     enable_collisions: bool = False
+    collision_broad_phase: str = "grid"
     constraint_solver: ConstraintSolver = field(default_factory=ConstraintSolver)
+    # Joints and springs converge more slowly than contacts, so each gets its
+    # own per-step sweep budget.
+    constraint_iterations: int = 2
+    collision_iterations: int = 1
+    # Worker processes for runs whose bodies never interact; see _step_parallel.
+    workers: int = 1
 
     def add_body(self, body: Body) -> None:
-        if not body.forces:
-            body.add_force(GravityForce(direction=self.gravity))
+        if body.gravity is None:
+            body.gravity = self._absorb_gravity(body)
         self.bodies.add(body)
 
     def add_bodies(self, bodies: Iterable[Body]) -> None:
         for body in bodies:
             self.add_body(body)
 
+    def _absorb_gravity(self, body: Body) -> Vector3:
+        """Strip ``GravityForce`` tags from ``body`` and return their summed acceleration.
+
+        Gravity is mass-proportional, so it is applied as a uniform
+        acceleration in the integrators rather than evaluated as a force at
+        every stage.  Bodies added without any forces fall under
+        ``self.gravity``.
+        """
+        if not body.forces:
+            return self.gravity
+        gravity = ZERO_VECTOR
+        remaining = []
+        for force in body.forces:
+            if type(force) is GravityForce:
+                gravity += force.direction
+            else:
+                remaining.append(force)
+        body.forces = remaining
+        return gravity
+
+    def reset(self) -> None:
+        """Remove all bodies and constraints so the simulation can be reused."""
+        self.bodies.clear()
+        self.constraint_solver.clear_constraints()
+
     def step(self, steps: int) -> SimulationResult:
-        history: List[Dict[str, dict]] = []
+        position_history: List[array] = []
+        velocity_history: List[array] = []
         energy_history: List[float] = []
         total_collision_count = 0
+        # Bodies cannot be added or removed mid-run, so take the list once
+        # instead of rebuilding it for every phase of every step.
+        bodies = self.bodies.all()
 
-        for _ in range(steps):
-            snapshot: Dict[str, dict] = {}
-            total_energy = 0.0
-
-            for body in self.bodies.all():
-                if self.method == "rk4":
-                    new_position, new_velocity = rk4_step(
-                        self.timestep,
-                        body.position,
-                        body.velocity,
-                        lambda pos, vel, body=body: body.net_force_for_state(pos, vel) / body.mass,
-                    )
-                elif self.method == "euler":
-                    accel = body.net_force() / body.mass
-                    new_position, new_velocity = euler_step(
-                        self.timestep,
-                        body.position,
-                        body.velocity,
-                        accel,
-                    )
-                else:
-                    raise ValueError(f"Unknown integration method: {self.method}")
+        if self._has_closed_form(bodies):
+            return self._step_closed_form(bodies, steps)
 
-                body.position = new_position
-                body.velocity = new_velocity
+        # Resolve the integrator once per run rather than once per body per step.
+        if self.method == "rk4":
+            step_body = self._rk4_body
+        elif self.method == "euler":
+            step_body = self._euler_body
+        else:
+            raise ValueError(f"Unknown integration method: {self.method}")
+
+        # Bodies driven only by built-in forces get a compiled scalar kernel;
+        # the rest evaluate their forces one by one.
+        kernels = [
+            compile_acceleration(body.forces, body.mass, _gravity_of(body)) for body in bodies
+        ]
+
+        # Custom forces may close over arbitrary state, so only bodies with
+        # compiled kernels are shipped to worker processes.
+        if (
+            self.workers > 1
+            and len(bodies) > 1
+            and not self.enable_collisions
+            and not self.constraint_solver.constraints
+            and None not in kernels
+        ):
+            return self._step_parallel(bodies, steps)
+
+        for _ in range(steps):
+            for body, kernel in zip(bodies, kernels):
+                body.position, body.velocity = step_body(body, kernel)
 
             # Handle collisions if enabled
             if self.enable_collisions:
-                collisions = CollisionDetector.detect_all_collisions(self.bodies.all())
-                total_collision_count += len(collisions)
-                
-                for collision in collisions:
-                    body1 = self.bodies.get(collision.body1_id)
-                    body2 = self.bodies.get(collision.body2_id)
-                    CollisionResolver.resolve_collision(collision, body1, body2, self.timestep)
+                for sweep in range(self.collision_iterations):
+                    collisions = CollisionDetector.detect_all_collisions(
+                        bodies, broad_phase=self.collision_broad_phase
+                    )
+                    if not collisions:
+                        break
+                    # Later sweeps only re-resolve contacts still overlapping;
+                    # count each contact once per step.
+                    if sweep == 0:
+                        total_collision_count += len(collisions)
+                    
+                    for collision in collisions:
+                        body1 = self.bodies.get(collision.body1_id)
+                        body2 = self.bodies.get(collision.body2_id)
+                        CollisionResolver.resolve_collision(collision, body1, body2, self.timestep)
 
             # Apply constraints
-            self.constraint_solver.solve(self.bodies, self.timestep, iterations=2)
-
-            # Calculate energy and create snapshot
-            for body in self.bodies.all():
-                kinetic = 0.5 * body.mass * (body.velocity.magnitude() ** 2)
-                potential = -body.mass * self.gravity.dot(body.position)
-                total_energy += kinetic + potential
+            self.constraint_solver.solve(
+                self.bodies, self.timestep, iterations=self.constraint_iterations
+            )
 
-                snapshot[body.identifier] = {
-                    "position": body.position.to_tuple(),
-                    "velocity": body.velocity.to_tuple(),
-                }
-
-            history.append(snapshot)
+            positions, velocities, total_energy = self._record_state(bodies)
+            position_history.append(positions)
+            velocity_history.append(velocities)
             energy_history.append(total_energy)
 
         return SimulationResult(
-            steps=history, 
+            identifiers=[body.identifier for body in bodies],
+            positions=position_history,
+            velocities=velocity_history,
             total_time=steps * self.timestep, 
             conserved_energy=energy_history,
             collision_count=total_collision_count
         )
 
+    def _step_parallel(self, bodies: List[Body], steps: int) -> SimulationResult:
+        """Integrate contiguous chunks of ``bodies`` in ``workers`` processes.
+
+        Without collisions or constraints each trajectory depends only on its
+        own body, so every chunk runs all ``steps`` independently and the
+        packed per-step states are concatenated afterwards.  Energies are summed
+        chunk by chunk and may differ from a serial run in the last bits.
+        """
+        chunk_size = -(-len(bodies) // self.workers)
+        chunks = [bodies[start:start + chunk_size] for start in range(0, len(bodies), chunk_size)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(
+                _integrate_chunk,
+                repeat(self.timestep),
+                repeat(self.method),
+                repeat(self.gravity),
+                chunks,
+                repeat(steps),
+            ))
+
+        # The workers moved copies; bring the originals to the final state.
+        if steps:
+            for chunk, result in zip(chunks, results):
+                positions = result.positions[-1]
+                velocities = result.velocities[-1]
+                for offset, body in zip(range(0, 3 * len(chunk), 3), chunk):
+                    body.position = Vector3(*positions[offset:offset + 3])
+                    body.velocity = Vector3(*velocities[offset:offset + 3])
+
+        position_history: List[array] = []
+        velocity_history: List[array] = []
+        for k in range(steps):
+            positions = array("d")
+            velocities = array("d")
+            for result in results:
+                positions.extend(result.positions[k])
+                velocities.extend(result.velocities[k])
+            position_history.append(positions)
+            velocity_history.append(velocities)
+
+        return SimulationResult(
+            identifiers=[body.identifier for body in bodies],
+            positions=position_history,
+            velocities=velocity_history,
+            total_time=steps * self.timestep,
+            conserved_energy=[sum(energies) for energies in zip(*(result.conserved_energy for result in results))],
+        )
+
+    def _rk4_body(self, body: Body, kernel: Optional[AccelerationKernel]) -> Tuple[Vector3, Vector3]:
+        if kernel is not None:
+            return rk4_step_kernel(self.timestep, body.position, body.velocity, kernel)
+        return rk4_step(self.timestep, body.position, body.velocity, body._accel)
+
+    def _euler_body(self, body: Body, kernel: Optional[AccelerationKernel]) -> Tuple[Vector3, Vector3]:
+        position, velocity = body.position, body.velocity
+        if kernel is not None:
+            accel = Vector3(*kernel(position.x, position.y, position.z, velocity.x, velocity.y, velocity.z))
+        else:
+            accel = body.net_force() * body.inv_mass + _gravity_of(body)
+        return euler_step(self.timestep, position, velocity, accel)
+
+    def _record_state(self, bodies: List[Body]) -> Tuple[array, array, float]:
+        """Return the packed positions, velocities and total mechanical energy of ``bodies``."""
+        positions: List[float] = []
+        velocities: List[float] = []
+        total_energy = 0.0
+        # Unpack gravity once per snapshot (not cached on the instance, so a
+        # reassigned ``gravity`` is always honoured).
+        gx, gy, gz = self.gravity.to_tuple()
+        for body in bodies:
+            px, py, pz = body.position.to_tuple()
+            vx, vy, vz = body.velocity.to_tuple()
+            kinetic = 0.5 * body.mass * (vx * vx + vy * vy + vz * vz)
+            potential = -body.mass * (gx * px + gy * py + gz * pz)
+            total_energy += kinetic + potential
+
+            positions += (px, py, pz)
+            velocities += (vx, vy, vz)
+        return array("d", positions), array("d", velocities), total_energy
+
+    def _has_closed_form(self, bodies: List[Body]) -> bool:
+        """Whether every body moves under a constant acceleration only.
+
+        RK4 integrates a constant acceleration exactly, so in that case the
+        trajectory can be evaluated in closed form instead of stepped.  Euler
+        is excluded because its discretisation error is part of the requested
+        result, as are collisions and constraints which couple the bodies.
+        """
+        if self.method != "rk4" or self.enable_collisions or self.constraint_solver.constraints:
+            return False
+        # Exact types only: a subclass may override ``compute`` with
+        # state-dependent behaviour, as in ``compile_acceleration``.
+        return all(
+            type(force) in (GravityForce, ConstantForce)
+            for body in bodies
+            for force in body.forces
+        )
+
+    def _step_closed_form(self, bodies: List[Body], steps: int) -> SimulationResult:
+        initial_states = []
+        for body in bodies:
+            acceleration = body.net_force() * body.inv_mass + _gravity_of(body)
+            initial_states.append((body, body.position, body.velocity, acceleration))
+
+        position_history: List[array] = []
+        velocity_history: List[array] = []
+        energy_history: List[float] = []
+        for k in range(1, steps + 1):
+            t = k * self.timestep
+            half_t_sq = 0.5 * t * t
+            for body, position, velocity, acceleration in initial_states:
+                body.position = position + velocity * t + acceleration * half_t_sq
+                body.velocity = velocity + acceleration * t
+
+            positions, velocities, total_energy = self._record_state(bodies)
+            position_history.append(positions)
+            velocity_history.append(velocities)
+            energy_history.append(total_energy)
+
+        return SimulationResult(
+            identifiers=[body.identifier for body in bodies],
+            positions=position_history,
+            velocities=velocity_history,
+            total_time=steps * self.timestep,
+            conserved_energy=energy_history,
+        )
+
+
+def _integrate_chunk(
+    timestep: float, method: str, gravity: Vector3, bodies: List[Body], steps: int
+) -> SimulationResult:
+    """Run ``bodies`` serially in a fresh simulation; executed in a worker process."""
+    simulation = Simulation(timestep=timestep, method=method, gravity=gravity)
+    for body in bodies:
+        # Register directly: gravity was already folded in by the parent.
+        simulation.bodies.add(body)
+    return simulation.step(steps)
+
+
+def _gravity_of(body: Body) -> Vector3:
+    """Gravity folded into ``body``, or zero if it was never added via ``add_body``."""
+    return ZERO_VECTOR if body.gravity is None else body.gravity
+
 
 def create_body(
     identifier: str,
@@ -166,3 +386,6 @@ def create_body(
                 raise ValueError(f"Unsupported force type: {kind}")
 
     return body
+
+
+__all__ = ["SimulationResult", "Simulation", "create_body"]
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from math import sqrt
+from operator import itemgetter
 from typing import Iterable, Tuple
 
 
-@dataclass(frozen=True)
-class Vector3:
+class Vector3(tuple):
     """Simple immutable 3D vector with basic arithmetic helpers.
 
     The engine intentionally keeps a small footprint so that it can run on
     minimal environments such as Alpine Linux where compiled dependencies are
     harder to install.  All operations use pure Python and the standard library.
+
+    Vectors are created in every integrator stage, so the class is a tuple
+    subclass rather than a frozen dataclass: construction is a single
+    ``tuple.__new__`` call instead of one ``object.__setattr__`` per field,
+    and the components are read-only properties, so shared instances such as
+    ``ZERO_VECTOR`` cannot be modified.  Operators always return new vectors.
     """
 
-    x: float
-    y: float
-    z: float = 0.0
+    __slots__ = ()
+
+    def __new__(cls, x: float, y: float, z: float = 0.0) -> "Vector3":
+        return tuple.__new__(cls, (x, y, z))
+
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+    z = property(itemgetter(2))
+
+    def __getnewargs__(self) -> Tuple[float, float, float]:
+        return tuple(self)
+
+    def __repr__(self) -> str:
+        return f"Vector3(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+    # A vector never compares equal to a plain tuple with the same components.
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is self.__class__ and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return other.__class__ is not self.__class__ or tuple.__ne__(self, other)
+
+    __hash__ = tuple.__hash__
 
     def __add__(self, other: "Vector3") -> "Vector3":
         return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -29,19 +54,26 @@ class Vector3:
 
     __rmul__ = __mul__
 
+    def scale(self, factor: float) -> "Vector3":
+        """Multiply by ``factor``; pass ``1.0 / length`` to divide without the zero check."""
+        return Vector3(self.x * factor, self.y * factor, self.z * factor)
+
     def __truediv__(self, scalar: float) -> "Vector3":
         if scalar == 0:
             raise ZeroDivisionError("Cannot divide a vector by zero")
         return Vector3(self.x / scalar, self.y / scalar, self.z / scalar)
 
     def magnitude(self) -> float:
-        return sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def magnitude_sq(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
 
     def normalize(self) -> "Vector3":
         mag = self.magnitude()
         if mag == 0:
             return Vector3(0.0, 0.0, 0.0)
-        return self / mag
+        return self.scale(1.0 / mag)
 
     def dot(self, other: "Vector3") -> float:
         return self.x * other.x + self.y * other.y + self.z * other.z
@@ -54,7 +86,7 @@ class Vector3:
         )
 
     def to_tuple(self) -> Tuple[float, float, float]:
-        return self.x, self.y, self.z
+        return tuple(self)
 
     @classmethod
     def from_iterable(cls, values: Iterable[float]) -> "Vector3":
@@ -63,4 +95,27 @@ class Vector3:
         return cls(float(x), float(y), float(z))
 
 
+class _Vec3Accum:
+    """Mutable running sum used where many vectors are added into one.
+
+    Summing with ``+`` allocates a new ``Vector3`` per term; this adds in
+    place and freezes the result once at the end.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def add(self, vector: Vector3) -> None:
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+
+    def freeze(self) -> Vector3:
+        return Vector3(self.x, self.y, self.z)
+
+
 ZERO_VECTOR = Vector3(0.0, 0.0, 0.0)
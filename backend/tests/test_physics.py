@@ -1,4 +1,4 @@
-from math import isclose, pi
+from math import cosh, isclose, pi
 from pathlib import Path
 import sys
 
@@ -6,9 +6,39 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import pytest
+
+from backend.physics import simulations
 from backend.physics.analytics import damped_oscillator, projectile_motion
+from backend.physics.bodies import BodyRegistry
+from backend.physics.collisions import CollisionDetector
+from backend.physics.constraints import (
+    Constraint,
+    ConstraintSolver,
+    DistanceConstraint,
+    PinConstraint,
+    SpringConstraint,
+)
+from backend.physics.forces import ConstantForce, CustomForce, compile_acceleration
+from backend.physics.integrators import rk4_step, rk4_step_kernel
 from backend.physics.simulations import Simulation, create_body
-from backend.physics.vector import Vector3
+from backend.physics.vector import ZERO_VECTOR, Vector3
+
+
+def _solver_setup(*constraints, **states):
+    """Return a registry of unit-mass bodies and a solver holding ``constraints``.
+
+    Each keyword maps a body identifier to its position, or to a
+    ``(position, velocity)`` pair; bodies given only a position start at rest.
+    """
+    registry = BodyRegistry()
+    for identifier, state in states.items():
+        position, velocity = state if isinstance(state, tuple) else (state, [0, 0, 0])
+        registry.add(create_body(identifier=identifier, mass=1.0, position=position, velocity=velocity))
+    solver = ConstraintSolver()
+    for constraint in constraints:
+        solver.add_constraint(constraint)
+    return registry, solver
 
 
 def test_projectile_motion_range():
@@ -84,3 +114,329 @@ def test_collision_detection():
     result = simulation.step(steps=50)
     assert result.collision_count > 0  # Should have detected collisions
     assert len(result.steps) == 50
+
+
+def test_broad_phases_match_all_pairs_scan():
+    bodies = [
+        create_body(
+            identifier=f"ball-{i}",
+            mass=1.0,
+            position=[(i % 6) * 1.2, (i // 6) * 1.2, (i % 3) * 0.4],
+            velocity=[0, 0, 0],
+            radius=0.5 + (i % 4) * 0.1,
+        )
+        for i in range(40)
+    ]
+    assert len(bodies) >= CollisionDetector.GRID_THRESHOLD
+
+    expected = [
+        (c.body1_id, c.body2_id)
+        for c in CollisionDetector.detect_all_collisions(bodies, broad_phase="naive")
+    ]
+    assert expected
+    for broad_phase in ("grid", "octree"):
+        detected = [
+            (c.body1_id, c.body2_id)
+            for c in CollisionDetector.detect_all_collisions(bodies, broad_phase=broad_phase)
+        ]
+        assert detected == expected
+
+
+def test_simulation_reset_allows_reuse():
+    simulation = Simulation(timestep=0.05, method="euler")
+    simulation.add_body(create_body(identifier="probe", mass=1.0, position=[0, 0, 0], velocity=[1, 0, 0]))
+    simulation.step(steps=5)
+
+    simulation.reset()
+    simulation.add_body(create_body(identifier="probe", mass=1.0, position=[0, 0, 0], velocity=[1, 0, 0]))
+    result = simulation.step(steps=1)
+    assert list(result.steps[0]) == ["probe"]
+
+
+def test_constant_acceleration_closed_form_matches_rk4():
+    def run(enable_collisions):
+        simulation = Simulation(timestep=0.02, method="rk4", enable_collisions=enable_collisions)
+        simulation.add_bodies([
+            create_body(identifier="falling", mass=2.0, position=[0, 10, 0], velocity=[3, 4, 0]),
+            create_body(
+                identifier="thrust",
+                mass=1.0,
+                position=[100, 0, 0],
+                velocity=[0, 0, 1],
+                forces=[{"type": "gravity"}, {"type": "constant", "vector": [1, 2, 0]}],
+            ),
+        ])
+        return simulation.step(steps=40)
+
+    # Enabling collisions (with bodies far apart) forces the stepped RK4 path.
+    closed_form, stepped = run(False), run(True)
+    for expected, actual in zip(stepped.steps, closed_form.steps):
+        for identifier, state in expected.items():
+            expected_values = state["position"] + state["velocity"]
+            actual_values = actual[identifier]["position"] + actual[identifier]["velocity"]
+            for a, b in zip(expected_values, actual_values):
+                assert isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_compiled_acceleration_matches_per_force_sum():
+    body = create_body(
+        identifier="mixed",
+        mass=2.5,
+        position=[1.0, 2.0, -0.5],
+        velocity=[3.0, -1.0, 0.25],
+        forces=[
+            {"type": "gravity"},
+            {"type": "constant", "vector": [0.5, 1.0, 0.0]},
+            {"type": "drag", "coefficient": 0.3},
+            {"type": "spring", "anchor": [0, 1, 0], "stiffness": 4.0, "damping": 0.2},
+            {"type": "friction", "coefficient_kinetic": 0.4},
+        ],
+    )
+    kernel = compile_acceleration(body.forces, body.mass)
+    expected = body.net_force() / body.mass
+    actual = kernel(*body.position.to_tuple(), *body.velocity.to_tuple())
+    for a, b in zip(expected.to_tuple(), actual):
+        assert isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+    body.add_force(CustomForce(func=lambda b: Vector3(0, 0, 0)))
+    assert compile_acceleration(body.forces, body.mass) is None
+
+
+def test_simulation_module_exports_collision_capable_simulation():
+    assert simulations.__all__ == ["SimulationResult", "Simulation", "create_body"]
+    simulation = simulations.Simulation(enable_collisions=True)
+    assert simulation.enable_collisions
+    assert simulation.constraint_solver.constraints == []
+
+
+def test_fused_rk4_paths_agree_with_textbook_rk4():
+    def accel(pos, vel):
+        return pos * -4.0 + vel * -0.3
+
+    def kernel(px, py, pz, vx, vy, vz):
+        return -4.0 * px - 0.3 * vx, -4.0 * py - 0.3 * vy, -4.0 * pz - 0.3 * vz
+
+    dt = 0.1
+    position, velocity = Vector3(1.0, -0.5, 0.25), Vector3(0.0, 2.0, -1.0)
+
+    k1_v, k1_p = accel(position, velocity), velocity
+    k2_v = accel(position + k1_p * (dt / 2), velocity + k1_v * (dt / 2))
+    k2_p = velocity + k1_v * (dt / 2)
+    k3_v = accel(position + k2_p * (dt / 2), velocity + k2_v * (dt / 2))
+    k3_p = velocity + k2_v * (dt / 2)
+    k4_v = accel(position + k3_p * dt, velocity + k3_v * dt)
+    k4_p = velocity + k3_v * dt
+    expected_velocity = velocity + (k1_v + 2 * k2_v + 2 * k3_v + k4_v) * (dt / 6)
+    expected_position = position + (k1_p + 2 * k2_p + 2 * k3_p + k4_p) * (dt / 6)
+
+    for new_position, new_velocity in (
+        rk4_step(dt, position, velocity, accel),
+        rk4_step_kernel(dt, position, velocity, kernel),
+    ):
+        expected_values = expected_position.to_tuple() + expected_velocity.to_tuple()
+        actual_values = new_position.to_tuple() + new_velocity.to_tuple()
+        for a, b in zip(expected_values, actual_values):
+            assert isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_constraint_solver_holds_rod_and_skips_missing_bodies():
+    simulation = Simulation(timestep=0.01, method="rk4")
+    simulation.add_bodies([
+        create_body(identifier="end-a", mass=1.0, position=[0, 0, 0], velocity=[0, 0, 0], forces=[]),
+        create_body(identifier="end-b", mass=1.0, position=[2, 0, 0], velocity=[3, 0, 0], forces=[]),
+    ])
+    simulation.constraint_solver.add_constraint(DistanceConstraint("end-a", "end-b", 2.0))
+    simulation.constraint_solver.add_constraint(DistanceConstraint("end-a", "missing", 1.0))
+
+    result = simulation.step(steps=20)
+    a = Vector3.from_iterable(result.steps[-1]["end-a"]["position"])
+    b = Vector3.from_iterable(result.steps[-1]["end-b"]["position"])
+    assert isclose((b - a).magnitude(), 2.0, rel_tol=1e-2)
+
+
+def test_warm_started_constraints_hold_hanging_chain():
+    simulation = Simulation(
+        timestep=0.01, method="rk4", constraint_solver=ConstraintSolver(warm_start=True)
+    )
+    simulation.add_bodies([
+        create_body(identifier=f"link-{i}", mass=1.0, position=[i, 0, 0], velocity=[0, 0, 0])
+        for i in range(6)
+    ])
+    simulation.constraint_solver.add_constraint(PinConstraint("link-0", Vector3(0, 0, 0)))
+    for i in range(5):
+        simulation.constraint_solver.add_constraint(DistanceConstraint(f"link-{i}", f"link-{i + 1}", 1.0))
+
+    result = simulation.step(steps=400)
+    final = result.steps[-1]
+    for i in range(5):
+        a = Vector3.from_iterable(final[f"link-{i}"]["position"])
+        b = Vector3.from_iterable(final[f"link-{i + 1}"]["position"])
+        assert isclose((b - a).magnitude(), 1.0, rel_tol=5e-2)
+
+
+def test_constraint_solver_skips_converged_constraints():
+    class CountingPin(PinConstraint):
+        calls = 0
+
+        def apply_resolved(self, bodies, dt):
+            CountingPin.calls += 1
+            return super().apply_resolved(bodies, dt)
+
+    registry, solver = _solver_setup(CountingPin("pinned", Vector3(1, 2, 3)), pinned=[1, 2, 3])
+    solver.solve(registry, dt=0.01, iterations=5)
+    assert CountingPin.calls == 1
+
+
+def test_constraint_solver_reorders_by_shared_bodies():
+    solved = []
+
+    class RecordingRod(DistanceConstraint):
+        def apply_resolved(self, bodies, dt):
+            solved.append(self.body_ids)
+            return super().apply_resolved(bodies, dt)
+
+    constraints = [
+        RecordingRod("a", "b", 1.0),
+        RecordingRod("x", "y", 1.0),
+        RecordingRod("b", "c", 1.0),
+        RecordingRod("y", "z", 1.0),
+    ]
+    registry, solver = _solver_setup(
+        *constraints, a=[0, 0, 0], b=[2, 0, 0], c=[4, 0, 0], x=[0, 5, 0], y=[2, 5, 0], z=[4, 5, 0]
+    )
+    solver.solve(registry, dt=0.01)
+
+    assert solved == [("a", "b"), ("b", "c"), ("x", "y"), ("y", "z")]
+    assert solver.constraints == constraints
+
+
+def test_add_body_absorbs_gravity_tags():
+    simulation = Simulation(timestep=0.01, method="euler")
+    tagged = create_body(
+        identifier="tagged",
+        mass=2.0,
+        position=[0, 0, 0],
+        velocity=[0, 0, 0],
+        forces=[{"type": "gravity", "direction": [0, -3, 0]}, {"type": "constant", "vector": [2, 0, 0]}],
+    )
+    untagged = create_body(identifier="untagged", mass=1.0, position=[0, 0, 0], velocity=[0, 0, 0])
+    simulation.add_bodies([tagged, untagged])
+
+    assert tagged.gravity == Vector3(0, -3, 0)
+    assert [type(force).__name__ for force in tagged.forces] == ["ConstantForce"]
+    assert untagged.gravity == simulation.gravity and untagged.forces == []
+
+    final = simulation.step(steps=1).steps[-1]
+    assert final["tagged"]["velocity"] == (0.01, -0.03, 0.0)
+
+
+def test_parallel_workers_match_serial_run():
+    def run(workers):
+        simulation = Simulation(timestep=0.01, method="rk4", workers=workers)
+        simulation.add_bodies([
+            create_body(
+                identifier=f"drag-{i}",
+                mass=1.0 + i,
+                position=[i, 0, 0],
+                velocity=[1, 2, 0],
+                forces=[{"type": "gravity"}, {"type": "drag", "coefficient": 0.1 * i}],
+            )
+            for i in range(5)
+        ])
+        return simulation, simulation.step(steps=20)
+
+    serial_simulation, serial = run(workers=1)
+    parallel_simulation, parallel = run(workers=2)
+    assert parallel.steps == serial.steps
+    for a, b in zip(serial.conserved_energy, parallel.conserved_energy):
+        assert isclose(a, b, rel_tol=1e-12)
+    assert parallel_simulation.bodies.get("drag-4").position == serial_simulation.bodies.get("drag-4").position
+
+
+def test_constraint_solver_does_not_overshoot_one_off_violation():
+    registry, solver = _solver_setup(DistanceConstraint("a", "b", 1.0), a=[0, 0, 0], b=[1.5, 0, 0])
+    previous = 1.5
+    for _ in range(4):
+        solver.solve(registry, dt=0.01)
+        distance = (registry.get("b").position - registry.get("a").position).magnitude()
+        assert 1.0 <= distance < previous
+        previous = distance
+
+
+def test_constraint_solver_solves_constraints_appended_to_list():
+    registry, solver = _solver_setup(a=[0, 0, 0], b=[3, 0, 0])
+    solver.solve(registry, dt=0.01)
+    solver.constraints.append(DistanceConstraint("a", "b", 1.0))
+
+    for _ in range(5):
+        solver.solve(registry, dt=0.01, iterations=2)
+    separation = registry.get("b").position - registry.get("a").position
+    assert isclose(separation.magnitude(), 1.0, rel_tol=1e-2)
+
+
+def test_spring_constraint_damping_applies_every_iteration():
+    def damped_speed(separation):
+        registry, solver = _solver_setup(
+            SpringConstraint("a", "b", rest_length=1.0, spring_constant=0.0, damping=1.0),
+            a=[0, 0, 0],
+            b=([separation, 0, 0], [1, 0, 0]),
+        )
+        solver.solve(registry, dt=0.01, iterations=2)
+        return registry.get("b").velocity.x
+
+    assert isclose(damped_speed(1.0), damped_speed(1.001), rel_tol=1e-12)
+
+
+def test_constraint_solver_supports_apply_only_subclasses():
+    class Floor(Constraint):
+        def apply(self, bodies, dt):
+            body = bodies.get("ball")
+            if body.position.y < 0:
+                body.position = Vector3(body.position.x, 0.0, body.position.z)
+
+    registry, solver = _solver_setup(Floor(), ball=[0, -2, 0])
+    solver.solve(registry, dt=0.01, iterations=2)
+    assert registry.get("ball").position == Vector3(0.0, 0.0, 0.0)
+
+
+def test_constraint_subclasses_must_implement_an_apply_path():
+    with pytest.raises(TypeError):
+        class Broken(Constraint):
+            pass
+
+    with pytest.raises(TypeError):
+        class MissingBodies(Constraint):
+            def apply_resolved(self, bodies, dt):
+                return 0.0
+
+    with pytest.raises(TypeError):
+        Constraint()
+
+
+def test_vector3_is_immutable_value_type():
+    with pytest.raises(AttributeError):
+        ZERO_VECTOR.x = 1.0
+    assert ZERO_VECTOR == Vector3(0.0, 0.0, 0.0)
+    assert Vector3(1, 2, 3) != (1, 2, 3)
+    assert {Vector3(1, 2, 3): "a"}[Vector3(1, 2, 3)] == "a"
+
+
+def test_projectile_motion_edge_cases():
+    result = projectile_motion(initial_speed=10, launch_angle=pi / 4, samples=0)
+    assert result.trajectory == [] and result.max_height == 0.0
+    with pytest.raises(ValueError):
+        projectile_motion(initial_speed=1, launch_angle=0.1, initial_height=-5)
+
+
+def test_closed_form_skips_force_subclasses():
+    class GrowingForce(ConstantForce):
+        def compute(self, body):
+            return Vector3(body.position.x, 0.0, 0.0)
+
+    simulation = Simulation(timestep=0.01, method="rk4")
+    body = create_body(identifier="growing", mass=1.0, position=[1, 0, 0], velocity=[0, 0, 0], forces=[])
+    body.add_force(GrowingForce(vector=Vector3(0, 0, 0)))
+    simulation.add_body(body)
+
+    final = simulation.step(steps=100).steps[-1]["growing"]["position"]
+    assert isclose(final[0], cosh(1.0), rel_tol=1e-6)